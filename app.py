@@ -13,120 +13,324 @@ Folder layout
 
 Install
 -------
-    pip install flask openai-whisper        # whisper CLI must be on PATH
+    pip install flask faster-whisper soundfile mutagen
+    pip install numba                       # optional, compiles the VTT scanner
+    pip install flask-compress              # optional, compresses JSON/HTML responses
 
 Run
 ---
     python3 app.py   # then open http://localhost:8000
+    gunicorn -k gthread --workers 1 --threads 8 -b 0.0.0.0:8000 wsgi:app   # production
 """
 from __future__ import annotations
 
+import collections
 import concurrent.futures
 import datetime  # Added for timestamping speed results
+import gzip
 import json
 import os
+import queue
 import subprocess
 import tempfile
 import threading
 import time
-from functools import lru_cache
+from functools import lru_cache, wraps
 from pathlib import Path
 
+import numpy as np
 from flask import (Flask, Response, jsonify, render_template, request,
                    send_from_directory, stream_with_context, url_for)
+from werkzeug.security import safe_join
+from mutagen import MutagenError
+from mutagen.mp3 import MP3
+
+try:
+    from flask_compress import Compress
+except ImportError: # pragma: no cover
+    Compress = None
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError: # pragma: no cover
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in so the scanner kernels still define without numba; they are not used then."""
+        return lambda fn: fn
+
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+except ImportError: # pragma: no cover
+    WhisperModel = None
 
 BASE   = Path(__file__).resolve().parent
 BOOKS  = BASE / "books"
 # SPEED_RATIOS_FILE is used to store speed ratios for model+settings combinations
 SPEED_RATIOS_FILE = BASE / "speed_ratios.json"
 MODEL  = "small" # Default model for transcriptions and speed tests
+WORKERS = 2 # Transcriptions that may run at once on the shared model
+SAMPLE_RATE = 16000 # faster-whisper expects 16 kHz mono float32 samples
+AUDIO_MAX_AGE = 3600 # Browser cache lifetime (seconds) for files served from /file/
+CAPTION_MAX_AGE = 86400 # VTTs only change when deleted and regenerated
 
-_jobs: dict[tuple[str, str], subprocess.Popen] = {}
-_lock = threading.Lock()
+_MODEL: WhisperModel | None = None
+_model_lock = threading.Lock()
+
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="whisper")
+# Running jobs. Only accessed through single dict operations (in, setdefault, pop, copy),
+# which are atomic under the GIL, so it has no lock
+_jobs: dict[tuple[str, str], concurrent.futures.Future] = {}
+# In-memory copy of speed_ratios.json, loaded on first use
+_ratios: dict | None = None
+_ratios_lock = threading.Lock()
+
+# Short file probes (durations, VTT scans) for the file-info endpoint
+_probe_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="probe")
 
 app = Flask(__name__, static_folder='static')
+# Compress JSON/HTML/VTT bodies when flask-compress is installed. Streamed transcription
+# logs are left alone so they keep reaching the browser line by line.
+app.config["COMPRESS_MIMETYPES"] = ['text/html', 'application/json', 'text/vtt', 'text/plain']
+app.config["COMPRESS_STREAMS"] = False
+if Compress is not None:
+    Compress(app)
 
 # ───────────────────────── helpers ────────────────────────────────
+def get_model() -> WhisperModel:
+    """Return the shared faster-whisper model, loading it on first use."""
+    global _MODEL
+    if _MODEL is None:
+        with _model_lock:
+            if _MODEL is None:
+                if WhisperModel is None:
+                    raise RuntimeError("faster-whisper is not installed")
+                # One set of weights serves every job; num_workers lets WORKERS
+                # transcriptions decode concurrently on it
+                if ctranslate2.get_cuda_device_count() > 0:
+                    device, compute_type = "cuda", "int8_float16"
+                else:
+                    device, compute_type = "cpu", "int8"
+                app.logger.info(f"Loading faster-whisper model '{MODEL}' on {device} ({compute_type})")
+                _MODEL = WhisperModel(MODEL, device=device, compute_type=compute_type,
+                                      num_workers=WORKERS)
+    return _MODEL
+
 @lru_cache(maxsize=1)
 def get_whisper_capabilities_cached():
-    """Test Whisper capabilities by checking help output. Result is cached."""
-    try:
-        result = subprocess.run(['whisper', '--help'],
-                               capture_output=True, text=True, timeout=10)
-        help_text = result.stdout + result.stderr
-        return {
-            'word_timestamps_available': '--word_timestamps' in help_text,
-            'highlight_words_available': '--highlight_words' in help_text,
-            'installed': result.returncode == 0
-        }
-    except Exception as e:
-        # Log the exception for server-side diagnosis
-        app.logger.error(f"Error getting Whisper capabilities: {e}")
-        return {
-            'word_timestamps_available': False,
-            'highlight_words_available': False,
-            'installed': False
-        }
+    """Report which transcription features are available. Result is cached."""
+    # faster-whisper always supports word timestamps; highlighting is done by our VTT writer
+    installed = WhisperModel is not None
+    return {
+        'word_timestamps_available': installed,
+        'highlight_words_available': installed,
+        'installed': installed
+    }
 
+def cached_by_dir_mtime(dir_for):
+    """Cache a directory scan until that directory's mtime changes.
+    dir_for maps the wrapped function's arguments to the directory it scans.
+    A missing directory yields an empty list.
+    """
+    def decorator(fn):
+        cache: dict[tuple, tuple[int, list]] = {}
+
+        @wraps(fn)
+        def wrapper(*args):
+            try:
+                # Stat before scanning, so a change during the scan is picked up next call
+                mtime_ns = os.stat(dir_for(*args)).st_mtime_ns
+            except FileNotFoundError:
+                cache.pop(args, None)
+                return []
+            hit = cache.get(args)
+            if hit is None or hit[0] != mtime_ns:
+                hit = (mtime_ns, fn(*args))
+                cache[args] = hit
+            return list(hit[1])
+        return wrapper
+    return decorator
+
+@cached_by_dir_mtime(lambda: BOOKS)
 def list_books() -> list[str]:
-    return sorted(p.name for p in BOOKS.iterdir() if p.is_dir())
+    with os.scandir(BOOKS) as entries:
+        return sorted(e.name for e in entries if e.is_dir())
 
+@cached_by_dir_mtime(lambda book: BOOKS / book)
 def list_mp3s(book: str) -> list[str]:
-    return sorted(f.name for f in (BOOKS / book).glob("*.mp3"))
+    with os.scandir(BOOKS / book) as entries:
+        return sorted(e.name for e in entries if e.name.endswith(".mp3"))
 
-@lru_cache(None)
 def caption_path(book: str, mp3: str) -> Path:
-    return (BOOKS / book) / (Path(mp3).with_suffix(".vtt"))
+    # Cheaper to recompute than to look up in a cache; mp3 names end in ".mp3"
+    return BOOKS / book / (mp3.removesuffix(".mp3") + ".vtt")
 
 def job_running(book: str, mp3: str) -> bool:
-    with _lock:
-        return (book, mp3) in _jobs
+    return (book, mp3) in _jobs
 
 def has_word_timestamps(vtt_path: Path) -> bool:
-    """Check if a VTT file contains word-level timestamps"""
-    if not vtt_path.exists():
+    """Check if a VTT file contains word-level timestamps. Cached until the file changes."""
+    try:
+        stat = vtt_path.stat()
+    except OSError:
         return False
+    return _scan_word_timestamps(str(vtt_path), stat.st_mtime_ns, stat.st_size)
 
+@lru_cache(maxsize=128)
+def _scan_word_timestamps(vtt_path: str, mtime_ns: int, size: int) -> bool:
+    if HAVE_NUMBA:
+        try:
+            return _scan_word_timestamps_compiled(vtt_path)
+        except Exception as e:
+            app.logger.warning(f"Compiled VTT scan failed for {vtt_path} ({e}), using the text scanner.")
+    return _scan_word_timestamps_text(vtt_path)
+
+def _scan_word_timestamps_compiled(vtt_path: str, chunk_size: int = 64 * 1024) -> bool:
+    # Feed the kernel whole lines a chunk at a time, so files with word-level cues near
+    # the top stop after the first read instead of being loaded in full
+    count = 0
+    tail = b""
+    with open(vtt_path, 'rb') as f:
+        while count < 3:
+            chunk = f.read(chunk_size)
+            data = tail + chunk
+            cut = len(data) if not chunk else data.rfind(b"\n") + 1
+            if cut:
+                count += count_wordlevel_indicators(np.frombuffer(data, dtype=np.uint8, count=cut), 3 - count)
+            tail = data[cut:]
+            if not chunk:
+                break
+    return count >= 3
+
+def _scan_word_timestamps_text(vtt_path: str) -> bool:
     try:
-        content = vtt_path.read_text(encoding='utf-8')
         # Look for word-level timestamp markers in VTT format
         # Check for multiple word-level cues (indicating word-by-word timing)
         # or highlighted words with <u> tags or <c> tags
-        lines = content.split('\n')
+        # Stream line by line and stop as soon as enough indicators are seen
         word_level_indicators = 0
-
-        for line in lines:
-            # Count lines with word highlighting tags
-            if '<u>' in line or '<c>' in line or '<c.highlight>' in line:
-                word_level_indicators += 1
-            # Count very short timestamp intervals (typical of word-level timing)
-            elif '-->' in line:
-                try:
-                    parts = line.split('-->')
-                    if len(parts) == 2:
-                        start_str = parts[0].strip()
-                        end_str = parts[1].strip()
-                        # Parse timestamps (simplified)
-                        start_time = float(start_str.split(':')[-1])
-                        end_time = float(end_str.split(':')[-1])
-                        # If the interval is very short (< 2 seconds), likely word-level
-                        if 0 < (end_time - start_time) < 2.0:
-                            word_level_indicators += 1
-                except (ValueError, IndexError):
-                    continue
-
-        # Consider it word-level if we have multiple word-level indicators
-        return word_level_indicators >= 3
+        with open(vtt_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                # Count lines with word highlighting tags
+                if '<u>' in line or '<c>' in line or '<c.highlight>' in line:
+                    word_level_indicators += 1
+                # Count very short timestamp intervals (typical of word-level timing)
+                elif '-->' in line:
+                    start_str, _, end_str = line.partition('-->')
+                    try:
+                        # Parse timestamps (simplified: seconds field only)
+                        start_time = float(start_str.strip().rpartition(':')[2])
+                        end_time = float(end_str.strip().rpartition(':')[2])
+                    except ValueError:
+                        continue
+                    # If the interval is very short (< 2 seconds), likely word-level
+                    if 0 < (end_time - start_time) < 2.0:
+                        word_level_indicators += 1
+                # Consider it word-level if we have multiple word-level indicators
+                if word_level_indicators >= 3:
+                    return True
+        return False
     except Exception:
         return False
 
+# ──────────── compiled VTT scanner (used when numba is installed) ────────────
+# Same rules as _scan_word_timestamps_text, applied to the raw UTF-8 bytes
+_U_TAG = np.frombuffer(b"<u>", dtype=np.uint8)
+_C_TAG = np.frombuffer(b"<c>", dtype=np.uint8)
+_C_HIGHLIGHT_TAG = np.frombuffer(b"<c.highlight>", dtype=np.uint8)
+_ARROW = np.frombuffer(b"-->", dtype=np.uint8)
+
+@njit(cache=True)
+def _find_bytes(buf, start, end, pat):
+    """Index of the first occurrence of pat in buf[start:end], or -1"""
+    m = len(pat)
+    for i in range(start, end - m + 1):
+        j = 0
+        while j < m and buf[i + j] == pat[j]:
+            j += 1
+        if j == m:
+            return i
+    return -1
+
+@njit(cache=True)
+def _is_space(b):
+    return b == 32 or (9 <= b <= 13)
+
+@njit(cache=True)
+def _seconds_field_us(buf, start, end):
+    """Parse the field after the last ':' in buf[start:end] as microseconds, or -1"""
+    while start < end and _is_space(buf[start]):
+        start += 1
+    while end > start and _is_space(buf[end - 1]):
+        end -= 1
+    i = end - 1
+    while i >= start and buf[i] != 58: # ':'
+        i -= 1
+    i += 1
+
+    whole = 0
+    frac = 0
+    scale = 1_000_000
+    digits = 0
+    seen_dot = False
+    for j in range(i, end):
+        b = buf[j]
+        if b == 46 and not seen_dot: # '.'
+            seen_dot = True
+        elif 48 <= b <= 57:
+            digits += 1
+            if not seen_dot:
+                whole = whole * 10 + (b - 48)
+            elif scale > 1:
+                scale //= 10
+                frac += (b - 48) * scale
+        else:
+            return -1
+    if digits == 0:
+        return -1
+    return whole * 1_000_000 + frac
+
+@njit(cache=True)
+def count_wordlevel_indicators(buf, limit):
+    """Count word-level indicator lines in a VTT buffer, stopping once limit is reached"""
+    count = 0
+    n = len(buf)
+    line_start = 0
+    while line_start < n and count < limit:
+        line_end = line_start
+        while line_end < n and buf[line_end] != 10: # '\n'
+            line_end += 1
+
+        if (_find_bytes(buf, line_start, line_end, _U_TAG) >= 0
+                or _find_bytes(buf, line_start, line_end, _C_TAG) >= 0
+                or _find_bytes(buf, line_start, line_end, _C_HIGHLIGHT_TAG) >= 0):
+            count += 1
+        else:
+            arrow = _find_bytes(buf, line_start, line_end, _ARROW)
+            if arrow >= 0:
+                start_us = _seconds_field_us(buf, line_start, arrow)
+                end_us = _seconds_field_us(buf, arrow + 3, line_end)
+                if start_us >= 0 and end_us >= 0 and 0 < end_us - start_us < 2_000_000:
+                    count += 1
+        line_start = line_end + 1
+    return count
+
 @lru_cache(maxsize=128) # Cache results for recently checked files
-def get_audio_duration(audio_path: Path) -> float:
-    """Get audio duration in seconds using ffprobe"""
+def get_audio_duration(audio_path: str, mtime_ns: int, size: int) -> float:
+    """Read the duration from the MP3 headers, falling back to ffprobe.
+    mtime_ns and size are part of the cache key, so a replaced file is probed again.
+    """
+    try:
+        return MP3(audio_path).info.length
+    except MutagenError as e:
+        app.logger.warning(f"mutagen could not read {audio_path} ({e}), trying ffprobe.")
+
     try:
         result = subprocess.run([
             'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1', str(audio_path)
+            '-of', 'default=noprint_wrappers=1:nokey=1', audio_path
         ], capture_output=True, text=True, timeout=10)
         if result.returncode == 0 and result.stdout.strip():
             return float(result.stdout.strip())
@@ -136,115 +340,202 @@ def get_audio_duration(audio_path: Path) -> float:
         app.logger.error(f"Error getting duration for {audio_path}: {e}")
 
     # Fallback: very rough estimate based on file size if ffprobe fails
+    file_size_mb = size / (1024 * 1024)
+    # Common bitrates for audiobooks are 64kbps-128kbps.
+    # 128 kbps = 16 KB/s. 1 MB = 1024 KB. So 1MB is approx 1024/16 = 64 seconds.
+    # Let's use a rough factor, e.g., 1MB ≈ 60 seconds (adjust if needed)
+    estimated_duration = file_size_mb * 60
+    app.logger.info(f"Estimating duration for {audio_path} by size: {estimated_duration:.2f}s")
+    return estimated_duration
+
+def _read_head_soundfile(source_audio: Path, duration_seconds: int) -> np.ndarray:
+    import soundfile
+
+    with soundfile.SoundFile(str(source_audio)) as f:
+        rate = f.samplerate
+        samples = f.read(frames=int(duration_seconds * rate), dtype='float32', always_2d=True)
+
+    samples = samples.mean(axis=1) # Downmix to mono
+    if rate != SAMPLE_RATE and samples.size:
+        # Linear resampling is plenty for a speed test
+        target_len = int(len(samples) * SAMPLE_RATE / rate)
+        positions = np.linspace(0, len(samples), target_len, endpoint=False)
+        samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+    return samples
+
+def _read_head_av(source_audio: Path, duration_seconds: int) -> np.ndarray:
+    import av # Installed with faster-whisper
+
+    needed = duration_seconds * SAMPLE_RATE
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+    chunks, decoded = [], 0
+    with av.open(str(source_audio)) as container:
+        # Stop decoding as soon as enough samples are in hand
+        for frame in container.decode(audio=0):
+            for out in resampler.resample(frame):
+                chunk = out.to_ndarray().reshape(-1)
+                chunks.append(chunk)
+                decoded += len(chunk)
+            if decoded >= needed:
+                break
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks)[:needed].astype(np.float32) / 32768.0
+
+def load_test_samples(source_audio: Path, duration_seconds: int = 15) -> np.ndarray | None:
+    """Decode the first N seconds of an audio file into 16 kHz mono samples.
+    Only the head of the file is decoded. soundfile is tried first; PyAV covers files
+    libsndfile cannot read (e.g. MP3 before libsndfile 1.1). Neither needs an ffmpeg binary.
+    """
     try:
-        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-        # Common bitrates for audiobooks are 64kbps-128kbps.
-        # 128 kbps = 16 KB/s. 1 MB = 1024 KB. So 1MB is approx 1024/16 = 64 seconds.
-        # Let's use a rough factor, e.g., 1MB ≈ 60 seconds (adjust if needed)
-        estimated_duration = file_size_mb * 60
-        app.logger.info(f"Estimating duration for {audio_path} by size: {estimated_duration:.2f}s")
-        return estimated_duration
+        samples = _read_head_soundfile(source_audio, duration_seconds)
     except Exception as e:
-        app.logger.error(f"Could not estimate duration by file size for {audio_path}: {e}")
-        return 0.0 # Should not happen if file exists
-
-def create_test_audio_clip(source_audio: Path, duration_seconds: int = 15) -> Path | None:
-    """Create a short test clip from the beginning of an audio file"""
-    temp_file = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False)
-    temp_path = Path(temp_file.name)
-    temp_file.close() # Close it so ffmpeg can write to it
-
-    try:
-        # Use ffmpeg to extract first N seconds
-        cmd = [
-            'ffmpeg', '-i', str(source_audio), '-t', str(duration_seconds),
-            '-acodec', 'copy', str(temp_path), '-y', '-hide_banner', '-loglevel', 'error'
-        ]
-        process = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if process.returncode != 0:
-            app.logger.error(f"ffmpeg error creating test clip: {process.stderr}")
-            if temp_path.exists(): temp_path.unlink()
-            return None
-
-        if temp_path.exists() and temp_path.stat().st_size > 0:
-            return temp_path
-        else: # pragma: no cover
-            app.logger.error(f"ffmpeg created an empty test clip from {source_audio}")
-            if temp_path.exists(): temp_path.unlink()
+        app.logger.info(f"soundfile could not decode {source_audio} ({e}), trying PyAV.")
+        try:
+            samples = _read_head_av(source_audio, duration_seconds)
+        except Exception as e:
+            app.logger.error(f"Could not decode test samples from {source_audio}: {e}")
             return None
 
-    except subprocess.TimeoutExpired:
-        app.logger.error(f"ffmpeg timed out creating test clip from {source_audio}")
-        if temp_path.exists(): temp_path.unlink()
-        return None
-    except FileNotFoundError: # pragma: no cover
-        app.logger.error("ffmpeg not found. Cannot create test audio clip.")
-        if temp_path.exists(): temp_path.unlink()
-        return None
-    except Exception as e: # pragma: no cover
-        app.logger.error(f"Unexpected error creating test clip: {e}")
-        if temp_path.exists(): temp_path.unlink()
+    if not samples.size:
+        app.logger.error(f"No audio samples decoded from {source_audio}")
         return None
+    return samples
 
-def test_whisper_speed(test_audio_path: Path, model_to_test: str, test_settings: dict) -> dict:
+def _time_transcription(model, samples: np.ndarray, word_timestamps: bool) -> float:
+    start_time = time.time()
+    segments, _ = model.transcribe(samples, word_timestamps=word_timestamps, vad_filter=True)
+    for _ in segments: # Segments are decoded lazily
+        pass
+    return time.time() - start_time
+
+def test_whisper_speed(test_samples: np.ndarray, model_to_test: str, test_settings: dict) -> dict:
     """Test Whisper transcription speed on a small audio sample.
     test_settings might include 'word_timestamps', 'highlighting' if these affect speed test.
-    However, Whisper CLI for a single run doesn't change much based on these VTT generation flags.
+    Highlighting only changes how the VTT is written, so only 'word_timestamps' is passed on.
     The primary factor is the model.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dir_path = Path(temp_dir)
-        capabilities = get_whisper_capabilities_cached()
-
-        cmd = [
-            "whisper", str(test_audio_path),
-            "--model", model_to_test, # Use the specified model
-            "--output_format", "vtt", # Minimal output, though VTT not strictly needed for speed test itself
-            "--output_dir", str(temp_dir_path),
-            "--fp16", "False", # Consistent setting
-        ]
-        # Add word_timestamps and highlight_words if they are part of test_settings and available
-        # These flags mostly affect VTT content, not raw speed significantly for a single run,
-        # but including them if specified for completeness of the tested configuration.
-        if test_settings.get("word_timestamps", True) and capabilities['word_timestamps_available']:
-            cmd.extend(["--word_timestamps", "True"])
-            if test_settings.get("highlighting", True) and capabilities['highlight_words_available']:
-                 cmd.extend(["--highlight_words", "True"])
-
-        start_time = time.time()
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120) # 2 min timeout
-            end_time = time.time()
-
-            processing_time = end_time - start_time
-            audio_duration = get_audio_duration(test_audio_path)
-
-            speed_ratio = (audio_duration / processing_time) if audio_duration > 0 and processing_time > 0 else 0
-
-            return {
-                'success': result.returncode == 0,
-                'processing_time': processing_time,
-                'audio_duration': audio_duration,
-                'speed_ratio': speed_ratio,
-                'model_tested': model_to_test,
-                'settings_tested': test_settings, # Record what settings were used for this ratio
-                'error': result.stderr if result.returncode != 0 else None
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                'success': False, 'error': 'Transcription speed test timed out',
-                'processing_time': 120, 'audio_duration': get_audio_duration(test_audio_path),
-                'speed_ratio': 0, 'model_tested': model_to_test, 'settings_tested': test_settings
-            }
-        except Exception as e: # pragma: no cover
-            app.logger.error(f"Exception during test_whisper_speed: {e}")
-            return {
-                'success': False, 'error': str(e),
-                'processing_time': 0, 'audio_duration': get_audio_duration(test_audio_path),
-                'speed_ratio': 0, 'model_tested': model_to_test, 'settings_tested': test_settings
-            }
+    audio_duration = len(test_samples) / SAMPLE_RATE
+    word_timestamps = test_settings.get("word_timestamps", True)
+
+    try:
+        # Load the model before timing: real jobs reuse the loaded model and never pay for it
+        model = get_model()
+        # Run on the shared executor so the clock only starts once a decode slot is free
+        processing_time = _executor.submit(_time_transcription, model, test_samples, word_timestamps).result()
+
+        speed_ratio = (audio_duration / processing_time) if audio_duration > 0 and processing_time > 0 else 0
+
+        return {
+            'success': True,
+            'processing_time': processing_time,
+            'audio_duration': audio_duration,
+            'speed_ratio': speed_ratio,
+            'model_tested': model_to_test,
+            'settings_tested': test_settings, # Record what settings were used for this ratio
+            'error': None
+        }
+    except Exception as e: # pragma: no cover
+        app.logger.error(f"Exception during test_whisper_speed: {e}")
+        return {
+            'success': False, 'error': str(e),
+            'processing_time': 0, 'audio_duration': audio_duration,
+            'speed_ratio': 0, 'model_tested': model_to_test, 'settings_tested': test_settings
+        }
 
 # ───────────────────────── whisper streamer ───────────────────────
+def format_timestamp(seconds: float) -> str:
+    """Format seconds as a VTT timestamp (HH:MM:SS.mmm)"""
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+def vtt_cues(segment, highlight: bool):
+    """Yield (start, end, text) cues for a segment, laid out like the whisper CLI's VTT writer.
+    With highlighting, every word gets its own cue with that word wrapped in <u>, which is
+    what the player uses for word-level sync.
+    """
+    words = segment.words
+    if not (highlight and words):
+        yield format_timestamp(segment.start), format_timestamp(segment.end), segment.text.strip().replace("-->", "->")
+        return
+
+    texts = [word.word for word in words]
+    line = "".join(texts)
+    last = format_timestamp(words[0].start)
+    for i, word in enumerate(words):
+        start, end = format_timestamp(word.start), format_timestamp(word.end)
+        if last != start:
+            yield last, start, line
+        stripped = texts[i].lstrip()
+        underlined = texts[i][:len(texts[i]) - len(stripped)] + f"<u>{stripped}</u>"
+        yield start, end, "".join(texts[:i] + [underlined] + texts[i + 1:])
+        last = end
+
+def transcribe_to_vtt(mp3_path: Path, vtt_path: Path, enable_word_timestamps: bool,
+                      enable_highlighting: bool, emit) -> None:
+    """Transcribe one file on the shared model, writing cues as segments are decoded.
+    Progress lines are passed to emit(). The VTT only appears under its final name once complete.
+    """
+    segments, info = get_model().transcribe(str(mp3_path), word_timestamps=enable_word_timestamps,
+                                            vad_filter=True)
+    emit(f"Detected language: {info.language} (p={info.language_probability:.2f}), "
+         f"audio duration: {info.duration:.1f}s\n")
+
+    highlight = enable_word_timestamps and enable_highlighting
+    partial_path = vtt_path.with_name(vtt_path.name + ".part")
+    try:
+        with partial_path.open("w", encoding="utf-8") as f:
+            f.write("WEBVTT\n\n")
+            for segment in segments:
+                for start, end, text in vtt_cues(segment, highlight):
+                    f.write(f"{start} --> {end}\n{text}\n\n")
+                emit(f"[{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}] {segment.text.strip()}\n")
+        os.replace(partial_path, vtt_path)
+        precompress(vtt_path)
+        refresh_meta(mp3_path, vtt_path)
+    finally:
+        if partial_path.exists():
+            partial_path.unlink()
+
+def precompress(path: Path):
+    """Write path.gz next to a finished file, for serve_file and nginx's gzip_static"""
+    gz_path = path.with_name(path.name + ".gz")
+    tmp_path = gz_path.with_name(gz_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(gzip.compress(path.read_bytes(), compresslevel=9))
+        os.replace(tmp_path, gz_path)
+    except OSError as e:
+        app.logger.warning(f"Could not precompress {path}: {e}")
+
+def _run_job(job: concurrent.futures.Future, fn, *args):
+    if not job.set_running_or_notify_cancel():
+        return
+    try:
+        job.set_result(fn(*args))
+    except BaseException as e:
+        job.set_exception(e)
+
+def submit_job(book: str, mp3: str, enable_word_timestamps: bool, enable_highlighting: bool,
+               emit) -> concurrent.futures.Future | None:
+    """Queue a transcription on the shared executor. Returns None if one is already running."""
+    key = (book, mp3)
+    # Claim the key before any work is queued: setdefault is atomic under the GIL, so
+    # exactly one caller wins and _jobs needs no lock
+    job = concurrent.futures.Future()
+    if _jobs.setdefault(key, job) is not job:
+        return None
+    job.add_done_callback(lambda _: _jobs.pop(key, None))
+    try:
+        _executor.submit(_run_job, job, transcribe_to_vtt, BOOKS / book / mp3, caption_path(book, mp3),
+                         enable_word_timestamps, enable_highlighting, emit)
+    except Exception:
+        _jobs.pop(key, None)
+        raise
+    return job
+
 def whisper_stream(book: str, mp3: str, enable_word_timestamps: bool = True, enable_highlighting: bool = True):
     app.logger.info(f"whisper_stream invoked with book='{book}', mp3='{mp3}'")
     app.logger.info(f"Script BASE directory (from Path(__file__).resolve().parent): {BASE}")
@@ -262,106 +553,84 @@ def whisper_stream(book: str, mp3: str, enable_word_timestamps: bool = True, ena
         yield f"Error: MP3 file not found: {mp3_path}\n"
         return
 
-    # Build command with optional features
-    cmd = [
-        "whisper", str(mp3_path),
-        "--model", MODEL,
-        "--output_format", "vtt",
-        "--output_dir", str(folder),
-        "--fp16", "False",  # Suppress FP16 warning
-    ]
-
-    # Add word-level features if requested and available
     capabilities = get_whisper_capabilities_cached()
-    if enable_word_timestamps and capabilities['word_timestamps_available']:
-        cmd.extend(["--word_timestamps", "True"])
-        if enable_highlighting and capabilities['highlight_words_available']:
-            cmd.extend(["--highlight_words", "True"])
+    if not capabilities['installed']:
+        yield "Error: faster-whisper is not installed\n"
+        return
 
+    enable_highlighting = enable_word_timestamps and enable_highlighting
     yield f"Starting Whisper transcription for: {mp3}\n"
-    yield f"Command: {' '.join(cmd)}\n"
-    yield f"Word timestamps: {'enabled' if enable_word_timestamps and capabilities['word_timestamps_available'] else 'disabled'}\n"
-    yield f"Word highlighting: {'enabled' if enable_highlighting and capabilities['highlight_words_available'] else 'disabled'}\n\n"
+    yield f"Model: {MODEL} (faster-whisper)\n"
+    yield f"Word timestamps: {'enabled' if enable_word_timestamps else 'disabled'}\n"
+    yield f"Word highlighting: {'enabled' if enable_highlighting else 'disabled'}\n\n"
+
+    # The job runs on the shared executor and keeps going if the client disconnects
+    lines: queue.Queue[str | None] = queue.Queue()
+    future = submit_job(book, mp3, enable_word_timestamps, enable_highlighting, lines.put)
+    if future is None:
+        yield f"A transcription job is already running for {mp3}\n"
+        return
+    future.add_done_callback(lambda _: lines.put(None))
+    yield from iter(lines.get, None)
 
     try:
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE, text=True, bufsize=1,
-                                creationflags=0 if os.name != 'nt' else subprocess.CREATE_NO_WINDOW)
-        with _lock:
-            _jobs[(book, mp3)] = proc
-
-        # Stream stdout
-        if proc.stdout:
-            for line in iter(proc.stdout.readline, ''):
-                line = line.rstrip()
-                if not line:
-                    continue
-                yield line + '\n'
-            proc.stdout.close()
-
-        # Wait for the process to complete and capture stderr
-        stderr_output = ""
-        if proc.stderr:
-            stderr_output = proc.stderr.read()
-            proc.stderr.close()
-
-        return_code = proc.wait()
-
-        with _lock:
-            _jobs.pop((book, mp3), None)
-
-        if stderr_output:
-            app.logger.error(f"Whisper process stderr for {mp3}:\n{stderr_output}")
-            yield f"\nSTDERR from Whisper:\n{stderr_output}\n"
-
-        # Verify the VTT file was created
-        expected_vtt = caption_path(book, mp3)
-        if expected_vtt.exists():
-            has_words = has_word_timestamps(expected_vtt)
-            yield f"\nSUCCESS: VTT file created at {expected_vtt}\n"
-            yield f"Word-level timestamps: {'Yes' if has_words else 'No'}\n"
-        else:
-            yield f"\nWARNING: Expected VTT file not found at {expected_vtt}\n"
-
-        if return_code != 0:
-            yield f"\nERROR: Whisper process failed with exit code {return_code}\n"
-        else:
-            yield f"\n[DONE {mp3} - SUCCESS]\n"
-
+        future.result()
     except Exception as e:
         app.logger.error(f"Exception in whisper_stream for {mp3}: {str(e)}", exc_info=True)
         yield f"\nEXCEPTION: {str(e)}\n"
-        with _lock:
-            _jobs.pop((book, mp3), None)
-
-def whisper_stream_parallel(book: str, mp3_files: list[str], max_workers: int = 2):
-    """Stream transcription of multiple files in parallel"""
-    yield f"Starting parallel transcription of {len(mp3_files)} files with {max_workers} workers\n\n"
+        yield f"\nERROR: Whisper transcription failed for {mp3}\n"
+        return
 
-    def transcribe_single(mp3):
-        """Transcribe a single file and collect output"""
-        output_lines = []
-        for line in whisper_stream(book, mp3):
-            output_lines.append(f"[{mp3}] {line}")
-        return mp3, output_lines
+    # Verify the VTT file was created
+    expected_vtt = caption_path(book, mp3)
+    if expected_vtt.exists():
+        has_words = has_word_timestamps(expected_vtt)
+        yield f"\nSUCCESS: VTT file created at {expected_vtt}\n"
+        yield f"Word-level timestamps: {'Yes' if has_words else 'No'}\n"
+        yield f"\n[DONE {mp3} - SUCCESS]\n"
+    else:
+        yield f"\nWARNING: Expected VTT file not found at {expected_vtt}\n"
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all jobs
-        future_to_mp3 = {executor.submit(transcribe_single, mp3): mp3 for mp3 in mp3_files}
+def whisper_stream_parallel(book: str, mp3_files: list[str], max_workers: int = 2,
+                            enable_word_timestamps: bool = True, enable_highlighting: bool = True):
+    """Stream transcription of multiple files in parallel on the shared model.
+    Concurrency is capped at WORKERS, the number of decode workers the model was loaded with.
+    """
+    max_workers = max(1, min(max_workers, WORKERS))
+    yield f"Starting parallel transcription of {len(mp3_files)} files with {max_workers} workers\n\n"
 
-        # Process results as they complete
-        for future in concurrent.futures.as_completed(future_to_mp3):
-            mp3 = future_to_mp3[future]
-            try:
-                mp3_name, output_lines = future.result()
-                yield f"\n=== COMPLETED: {mp3_name} ===\n"
-                for line in output_lines:
-                    yield line
-                yield f"=== END: {mp3_name} ===\n\n"
-            except Exception as e:
-                yield f"\n=== ERROR: {mp3} ===\n"
-                yield f"Exception: {str(e)}\n"
-                yield f"=== END ERROR: {mp3} ===\n\n"
+    # Every job reports (mp3, line) here, and (mp3, None) once it has finished
+    events: queue.Queue[tuple[str, str | None]] = queue.Queue()
+    pending = collections.deque(mp3_files)
+    running: dict[str, concurrent.futures.Future] = {}
+
+    while True:
+        # Keep max_workers files in flight; the next one starts as soon as one completes
+        while pending and len(running) < max_workers:
+            mp3 = pending.popleft()
+            future = submit_job(book, mp3, enable_word_timestamps, enable_highlighting,
+                                lambda line, mp3=mp3: events.put((mp3, line)))
+            if future is None:
+                yield f"=== SKIPPED: {mp3} (a transcription job is already running) ===\n\n"
+                continue
+            future.add_done_callback(lambda _, mp3=mp3: events.put((mp3, None)))
+            running[mp3] = future
+            yield f"=== STARTED: {mp3} ===\n"
+        if not running:
+            break
+
+        mp3, line = events.get()
+        if line is not None:
+            yield f"[{mp3}] {line}"
+            continue
+        try:
+            running.pop(mp3).result()
+            yield f"\n=== COMPLETED: {mp3} ===\n\n"
+        except Exception as e:
+            app.logger.error(f"Exception transcribing {mp3} in parallel batch: {e}", exc_info=True)
+            yield f"\n=== ERROR: {mp3} ===\n"
+            yield f"Exception: {str(e)}\n"
+            yield f"=== END ERROR: {mp3} ===\n\n"
 
 # ───────────────────────── routes ─────────────────────────────────
 @app.route("/")
@@ -390,26 +659,24 @@ def whisper_capabilities_route():
     """API endpoint to check Whisper capabilities (uses cached result)"""
     return jsonify(get_whisper_capabilities_cached())
 
+def _parse_bool_arg(value: str) -> bool:
+    return value.lower() == 'true'
+
 @app.route("/api/speed-ratio", methods=["GET"])
 def get_speed_ratio_route():
     try:
         # Query parameters define the configuration we're looking for
         # Default to global MODEL if not specified
         model_name = request.args.get('model', MODEL)
-        word_timestamps = request.args.get('word_timestamps', 'true').lower() == 'true'
+        word_timestamps = request.args.get('word_timestamps', True, type=_parse_bool_arg)
         # Client sends 'highlight_words', but speed_ratios.json and get_speed_test_key use 'highlighting'
-        highlight_words_param = request.args.get('highlight_words', 'true').lower() == 'true'
+        highlight_words_param = request.args.get('highlight_words', True, type=_parse_bool_arg)
 
-        query_settings = {
-            'word_timestamps': word_timestamps,
-            'highlighting': highlight_words_param # Map to 'highlighting' for the key
-        }
+        key_to_find = _speed_test_key(model_name, word_timestamps, highlight_words_param)
+        saved = load_saved_speed_ratios().get(key_to_find) # In-memory lookup, no disk I/O
 
-        key_to_find = get_speed_test_key(model_name, query_settings)
-        all_ratios = load_saved_speed_ratios()
-
-        if key_to_find in all_ratios:
-            return jsonify(all_ratios[key_to_find]) # Returns {'speed_ratio': X, 'model_tested': Y, ...}
+        if saved is not None:
+            return jsonify(saved) # Returns {'speed_ratio': X, 'model_tested': Y, ...}
         else:
             return jsonify({"message": f"No speed ratio found for key: {key_to_find}"}), 404
     except Exception as e: # pragma: no cover
@@ -437,8 +704,7 @@ def whisper_speed_test():
         # Select a short, representative file for the test clip
         # Prefer a file around 1-5 minutes if possible, otherwise shortest.
         # For simplicity, still using the shortest, or first, if durations aren't easily available here.
-        # The test_audio_clip creation handles fixed duration.
-        # It's important that create_test_audio_clip gets a valid source_audio.
+        # load_test_samples only decodes a fixed duration from the start of the file.
         source_audio_name = mp3_files[0] # Default, pick first
         if book_file_info_for_estimates: # if client sent file_info, try to pick a reasonably short one
             shortest_duration = float('inf')
@@ -453,59 +719,55 @@ def whisper_speed_test():
         if not source_audio_path.exists():
              return jsonify({"error": f"Selected source audio for test not found: {source_audio_path}"}), 400
 
-        test_audio_clip_path = create_test_audio_clip(source_audio_path, duration_seconds=15)
-        if not test_audio_clip_path:
-            return jsonify({"error": "Failed to create test audio clip"}), 500
-
-        try:
-            # Test with the current global MODEL and client-provided settings for the test config
-            speed_test_run_result = test_whisper_speed(test_audio_clip_path, MODEL, test_settings)
-
-            if speed_test_run_result['success'] and speed_test_run_result['speed_ratio'] > 0:
-                # Save this successful speed_ratio keyed by MODEL and test_settings
-                save_key = get_speed_test_key(MODEL, test_settings)
-                data_to_save = {
-                    "speed_ratio": speed_test_run_result['speed_ratio'],
-                    "model_tested": MODEL, # Explicitly state which model this ratio is for
-                    "settings_key_info": test_settings, # What settings produced this key
-                    "test_audio_duration": speed_test_run_result['audio_duration'],
-                    "test_processing_time": speed_test_run_result['processing_time'],
-                    "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
-                }
-                save_speed_ratio_data(save_key, data_to_save)
-
-                # For the immediate response, calculate estimates for the *current book's files*
-                # using the newly determined speed_ratio.
-                current_book_estimates = {}
-                for mp3_file_name, info in book_file_info_for_estimates.items():
-                    duration = info.get('duration', 0)
-                    if duration > 0:
-                        estimated_time = duration / speed_test_run_result['speed_ratio']
-                        current_book_estimates[mp3_file_name] = {
-                            'duration': duration,
-                            'estimated_time': estimated_time
-                        }
-
-                # Return success, new ratio, and on-the-fly estimates for current book
-                return jsonify({
-                    "success": True,
-                    "speed_ratio": speed_test_run_result['speed_ratio'],
-                    "model_tested": MODEL,
-                    "settings_tested_key_info": test_settings, # For user display confirmation
-                    "estimates": current_book_estimates # For immediate UI update for *this* book
-                })
-            else:
-                # Test failed or speed_ratio is 0
-                return jsonify({
-                    "success": False,
-                    "error": speed_test_run_result.get('error', "Speed test failed or resulted in zero speed ratio."),
-                    "speed_ratio": 0,
-                    "model_tested": MODEL,
-                    "settings_tested_key_info": test_settings
-                }), 200 # Return 200 OK but with success:false and an error message
-        finally:
-            if test_audio_clip_path and test_audio_clip_path.exists():
-                test_audio_clip_path.unlink() # Cleanup test clip
+        test_samples = load_test_samples(source_audio_path, duration_seconds=15)
+        if test_samples is None:
+            return jsonify({"error": "Failed to load test audio samples"}), 500
+
+        # Test with the current global MODEL and client-provided settings for the test config
+        speed_test_run_result = test_whisper_speed(test_samples, MODEL, test_settings)
+
+        if speed_test_run_result['success'] and speed_test_run_result['speed_ratio'] > 0:
+            # Save this successful speed_ratio keyed by MODEL and test_settings
+            save_key = get_speed_test_key(MODEL, test_settings)
+            data_to_save = {
+                "speed_ratio": speed_test_run_result['speed_ratio'],
+                "model_tested": MODEL, # Explicitly state which model this ratio is for
+                "settings_key_info": test_settings, # What settings produced this key
+                "test_audio_duration": speed_test_run_result['audio_duration'],
+                "test_processing_time": speed_test_run_result['processing_time'],
+                "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
+            }
+            save_speed_ratio_data(save_key, data_to_save)
+
+            # For the immediate response, calculate estimates for the *current book's files*
+            # using the newly determined speed_ratio.
+            current_book_estimates = {}
+            for mp3_file_name, info in book_file_info_for_estimates.items():
+                duration = info.get('duration', 0)
+                if duration > 0:
+                    estimated_time = duration / speed_test_run_result['speed_ratio']
+                    current_book_estimates[mp3_file_name] = {
+                        'duration': duration,
+                        'estimated_time': estimated_time
+                    }
+
+            # Return success, new ratio, and on-the-fly estimates for current book
+            return jsonify({
+                "success": True,
+                "speed_ratio": speed_test_run_result['speed_ratio'],
+                "model_tested": MODEL,
+                "settings_tested_key_info": test_settings, # For user display confirmation
+                "estimates": current_book_estimates # For immediate UI update for *this* book
+            })
+        else:
+            # Test failed or speed_ratio is 0
+            return jsonify({
+                "success": False,
+                "error": speed_test_run_result.get('error', "Speed test failed or resulted in zero speed ratio."),
+                "speed_ratio": 0,
+                "model_tested": MODEL,
+                "settings_tested_key_info": test_settings
+            }), 200 # Return 200 OK but with success:false and an error message
     except Exception as e: # pragma: no cover
         app.logger.error(f"Error in /api/whisper/speed-test: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
@@ -538,7 +800,8 @@ def stream_book_captions_route():
         return Response("All files already have transcripts\n", mimetype="text/plain")
 
     if parallel and len(files_to_process) > 1:
-        return Response(stream_with_context(whisper_stream_parallel(book, files_to_process, max_workers)),
+        return Response(stream_with_context(whisper_stream_parallel(book, files_to_process, max_workers,
+                                                                enable_word_timestamps, enable_highlighting)),
                         mimetype="text/plain")
     else:
         def batch():
@@ -574,20 +837,61 @@ def player_data(book):
 # ───────────────────────── static helper ──────────────────────────
 @app.route("/file/<book>/<path:filename>")
 def serve_file(book, filename):
-    return send_from_directory(BOOKS / book, filename)
+    # Conditional responses honour Range and If-None-Match/If-Modified-Since, so seeking
+    # in the player only transfers the requested byte window. The ETag tracks mtime and size.
+    folder = BOOKS / book
+    if not filename.endswith(".vtt"):
+        response = send_from_directory(folder, filename, conditional=True, etag=True, max_age=AUDIO_MAX_AGE)
+        response.headers.setdefault("Accept-Ranges", "bytes")
+        return response
+
+    # Captions have a .vtt.gz written next to them at transcription time; send that as-is
+    # to clients that accept gzip, as long as it is not older than the VTT itself
+    vtt_path = safe_join(str(folder), filename)
+    # Check the quality value: "gzip;q=0" lists gzip only to refuse it
+    if vtt_path and request.accept_encodings["gzip"] > 0 and _gzip_is_fresh(Path(vtt_path)):
+        response = send_from_directory(folder, filename + ".gz", mimetype="text/vtt",
+                                       download_name=Path(filename).name,
+                                       conditional=True, etag=True, max_age=CAPTION_MAX_AGE)
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = send_from_directory(folder, filename, conditional=True, etag=True, max_age=CAPTION_MAX_AGE)
+    response.headers.setdefault("Accept-Ranges", "bytes")
+    response.vary.add("Accept-Encoding")
+    return response
+
+def _gzip_is_fresh(path: Path) -> bool:
+    try:
+        return path.with_name(path.name + ".gz").stat().st_mtime_ns >= path.stat().st_mtime_ns
+    except OSError:
+        return False
 
 # ───────────────────────── speed test persistence ────────────────────────────────
 def get_speed_test_key(model_name: str, settings: dict) -> str:
     """Generate a unique key for speed test results based on model and settings."""
     # Settings from UI/client (e.g., word_timestamps, highlighting)
     # For now, assume these are the primary settings from client that might affect tested config.
-    # If whisper CLI changes speed based on more VTT flags, add them here.
-    word_ts = settings.get('word_timestamps', True)
-    highlight = settings.get('highlighting', True)
+    # If more transcription options start affecting speed, add them here.
     # Future: could add other settings like 'beam_size', 'temperature' if they become configurable for test
+    # Normalize to real booleans so client JSON like 1 or [] maps onto the same key as True/False
+    word_ts = bool(settings.get('word_timestamps', True))
+    highlight = bool(settings.get('highlighting', True))
+    return _speed_test_key(model_name, word_ts, highlight)
+
+@lru_cache(maxsize=64) # Only a handful of model/settings combinations ever occur
+def _speed_test_key(model_name: str, word_ts: bool, highlight: bool) -> str:
     return f"{model_name}:{word_ts}:{highlight}"
 
 def load_saved_speed_ratios() -> dict:
+    """Return all saved speed ratios. speed_ratios.json is only read on first use."""
+    global _ratios
+    if _ratios is None:
+        with _ratios_lock:
+            if _ratios is None:
+                _ratios = _read_speed_ratios_file()
+    return _ratios
+
+def _read_speed_ratios_file() -> dict:
     if SPEED_RATIOS_FILE.exists():
         try:
             return json.loads(SPEED_RATIOS_FILE.read_text(encoding='utf-8'))
@@ -597,11 +901,119 @@ def load_saved_speed_ratios() -> dict:
 
 def save_speed_ratio_data(key: str, data: dict):
     all_ratios = load_saved_speed_ratios()
-    all_ratios[key] = data # data includes speed_ratio, model_tested, settings_tested, timestamp etc.
+    with _ratios_lock:
+        all_ratios[key] = data # data includes speed_ratio, model_tested, settings_tested, timestamp etc.
+        # Write a temp file and swap it in, so a crash never leaves a torn speed_ratios.json
+        tmp_path = SPEED_RATIOS_FILE.with_suffix('.json.tmp')
+        try:
+            tmp_path.write_text(json.dumps(all_ratios, indent=2), encoding='utf-8')
+            os.replace(tmp_path, SPEED_RATIOS_FILE)
+        except IOError as e: # pragma: no cover
+            app.logger.error(f"Error saving speed ratios file {SPEED_RATIOS_FILE}: {e}")
+
+# Static part of each book's file-info response, keyed on the mp3/vtt names, mtimes and sizes
+_file_info_cache: dict[str, tuple[tuple, dict]] = {}
+
+def _scan_book(book_path: Path) -> tuple[dict[str, os.stat_result], dict[str, os.stat_result]]:
+    """One directory pass collecting the stat results of a book's mp3 and vtt files by name"""
+    mp3_stats, vtt_stats = {}, {}
+    with os.scandir(book_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".mp3"):
+                mp3_stats[entry.name] = entry.stat()
+            elif entry.name.endswith(".vtt"):
+                vtt_stats[entry.name] = entry.stat()
+    return mp3_stats, vtt_stats
+
+def meta_path(mp3_path: Path) -> Path:
+    return mp3_path.with_suffix(".meta.json")
+
+def read_meta(mp3_path: Path) -> dict:
+    """Load an mp3's metadata sidecar, or {} if it is missing or unreadable"""
+    try:
+        return json.loads(meta_path(mp3_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def write_meta(mp3_path: Path, meta: dict):
+    path = meta_path(mp3_path)
+    # A file-info probe and a finishing job can write the same sidecar at once, so each
+    # writer gets its own temp file; os.replace then swaps in one complete version
     try:
-        SPEED_RATIOS_FILE.write_text(json.dumps(all_ratios, indent=2), encoding='utf-8')
-    except IOError as e: # pragma: no cover
-        app.logger.error(f"Error saving speed ratios file {SPEED_RATIOS_FILE}: {e}")
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    except OSError as e: # e.g. a read-only book folder; the values are just recomputed next time
+        app.logger.warning(f"Could not write metadata sidecar {path}: {e}")
+        return
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        app.logger.warning(f"Could not write metadata sidecar {path}: {e}")
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+
+def _probe_file(mp3_path: Path, mp3_stat: os.stat_result,
+                vtt_path: Path, vtt_stat: os.stat_result | None) -> tuple[float, bool]:
+    # Both probes take the stat results from _scan_book, so nothing is stat'ed twice
+    vtt_mtime_ns, vtt_size = (vtt_stat.st_mtime_ns, vtt_stat.st_size) if vtt_stat else (None, None)
+    return _probe_file_cached(str(mp3_path), mp3_stat.st_mtime_ns, mp3_stat.st_size,
+                              str(vtt_path), vtt_mtime_ns, vtt_size)
+
+@lru_cache(maxsize=128) # In-memory tier above the .meta.json sidecars
+def _probe_file_cached(mp3_path: str, mtime_ns: int, size: int,
+                       vtt_path: str, vtt_mtime_ns: int | None, vtt_size: int | None) -> tuple[float, bool]:
+    """Duration and word-timestamp status of an mp3, from its sidecar when still valid.
+    Only the parts whose file changed since the sidecar was written are recomputed.
+    """
+    meta = read_meta(Path(mp3_path))
+    mp3_fresh = meta.get("mtime_ns") == mtime_ns and meta.get("size") == size
+    vtt_fresh = ("has_word_timestamps" in meta and meta.get("vtt_mtime_ns") == vtt_mtime_ns
+                 and meta.get("vtt_size") == vtt_size)
+    if mp3_fresh and vtt_fresh:
+        return meta["duration"], meta["has_word_timestamps"]
+
+    duration = meta["duration"] if mp3_fresh else get_audio_duration(mp3_path, mtime_ns, size)
+    if vtt_fresh:
+        has_words = meta["has_word_timestamps"]
+    else:
+        has_words = vtt_mtime_ns is not None and _scan_word_timestamps(vtt_path, vtt_mtime_ns, vtt_size)
+    write_meta(Path(mp3_path), {
+        "duration": duration, "size": size, "mtime_ns": mtime_ns,
+        "has_word_timestamps": has_words, "vtt_mtime_ns": vtt_mtime_ns, "vtt_size": vtt_size,
+    })
+    return duration, has_words
+
+def refresh_meta(mp3_path: Path, vtt_path: Path) -> tuple[float, bool]:
+    """Bring an mp3's sidecar up to date, e.g. right after its VTT was written"""
+    try:
+        vtt_stat = vtt_path.stat()
+    except FileNotFoundError:
+        vtt_stat = None
+    return _probe_file(mp3_path, mp3_path.stat(), vtt_path, vtt_stat)
+
+def _collect_file_info(book_path: Path, mp3_stats: dict, vtt_stats: dict) -> dict:
+    mp3_files = sorted(mp3_stats)
+    vtt_names = [mp3_file.removesuffix(".mp3") + ".vtt" for mp3_file in mp3_files]
+    # Probe all files concurrently; wall time is the slowest file rather than the sum
+    probes = [
+        _probe_executor.submit(_probe_file, book_path / mp3_file, mp3_stats[mp3_file],
+                               book_path / vtt_name, vtt_stats.get(vtt_name))
+        for mp3_file, vtt_name in zip(mp3_files, vtt_names)
+    ]
+
+    file_info_map = {}
+    for mp3_file, vtt_name, probe in zip(mp3_files, vtt_names, probes):
+        duration, has_words = probe.result()
+        file_info_map[mp3_file] = {
+            "duration": duration,
+            "size": mp3_stats[mp3_file].st_size,
+            "vtt_exists": vtt_name in vtt_stats,
+            "has_word_timestamps": has_words,
+        }
+    return file_info_map
 
 @app.route("/api/book/<book_name>/file-info")
 def book_file_info(book_name):
@@ -610,38 +1022,48 @@ def book_file_info(book_name):
         if not book_path.is_dir():
             return jsonify({"error": "Book not found"}), 404
 
-        file_info_map = {}
-        for mp3_file in list_mp3s(book_name):
-            mp3_path = book_path / mp3_file
-            vtt_file_path = caption_path(book_name, mp3_file)
-            vtt_exists = vtt_file_path.exists()
-            file_info_map[mp3_file] = {
-                "duration": get_audio_duration(mp3_path),
-                "size": mp3_path.stat().st_size,
-                "vtt_exists": vtt_exists,
-                "has_word_timestamps": has_word_timestamps(vtt_file_path) if vtt_exists else False,
-                "job_running": job_running(book_name, mp3_file)
-            }
+        mp3_stats, vtt_stats = _scan_book(book_path)
+        key = tuple(sorted((name, st.st_mtime_ns, st.st_size)
+                           for name, st in (*mp3_stats.items(), *vtt_stats.items())))
+        cached = _file_info_cache.get(book_name)
+        if cached is not None and cached[0] == key:
+            static_info = cached[1]
+        else:
+            static_info = _collect_file_info(book_path, mp3_stats, vtt_stats)
+            _file_info_cache[book_name] = (key, static_info)
+
+        # Job state changes independently of the files, so it is never cached.
+        # One snapshot of _jobs serves every file in the response.
+        running_jobs = _jobs.copy()
+        file_info_map = {
+            mp3_file: {**info, "job_running": (book_name, mp3_file) in running_jobs}
+            for mp3_file, info in static_info.items()
+        }
         return jsonify(file_info_map)
     except Exception as e: # pragma: no cover
         app.logger.error(f"Error in /api/book/{book_name}/file-info: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 # ───────────────────────── entry ────────────────────────────────
+def configure_logging():
+    """Send app.logger output to a rotating audiobooks_app.log"""
+    import logging
+    from logging.handlers import RotatingFileHandler
+    file_handler = RotatingFileHandler('audiobooks_app.log', maxBytes=1024 * 1024 * 10, backupCount=5) # 10MB per file
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
+    ))
+    file_handler.setLevel(logging.INFO)
+    app.logger.addHandler(file_handler)
+    app.logger.setLevel(logging.INFO)
+    app.logger.info('Audiobooks App startup')
+
 if __name__ == "__main__":
+    # Development server only; see wsgi.py for running under gunicorn
     BOOKS.mkdir(exist_ok=True) # Ensure the books directory exists
     # Configure logging
     if not app.debug: # pragma: no cover
-        import logging
-        from logging.handlers import RotatingFileHandler
-        file_handler = RotatingFileHandler('audiobooks_app.log', maxBytes=1024 * 1024 * 10, backupCount=5) # 10MB per file
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
-        ))
-        file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
-        app.logger.setLevel(logging.INFO)
-        app.logger.info('Audiobooks App startup')
+        configure_logging()
 
     print(f"Audiobooks server running. Access at http://localhost:8000 (Model: {MODEL})")
     app.run(host="0.0.0.0", port=8000, debug=True)
@@ -60,11 +60,11 @@ attempt_pyenv_install_guidance() {
 }
 
 # --- Dependency Checks (ffmpeg) ---
-echo "Checking for ffmpeg and ffprobe..."
-if command_exists ffmpeg && command_exists ffprobe; then
-    print_info "ffmpeg and ffprobe found."
+echo "Checking for ffprobe..."
+if command_exists ffprobe; then
+    print_info "ffprobe found."
 else
-    print_warning "ffmpeg or ffprobe not found in your system's PATH.\nThis application requires ffmpeg (and its component ffprobe) for:\n  1. Creating test audio clips for the Whisper speed test feature.\n  2. Getting accurate audio durations for files.\n\nPlease install ffmpeg. Common installation methods:\n  - macOS (using Homebrew): brew install ffmpeg\n  - Debian/Ubuntu Linux: sudo apt update && sudo apt install ffmpeg\n  - Fedora Linux: sudo dnf install ffmpeg\n  - Windows: Download from https://ffmpeg.org/download.html and add to PATH.\n\nAfter installation, please re-run this setup script or ensure\nffmpeg and ffprobe are accessible from your terminal before running the app."
+    print_warning "ffprobe not found in your system's PATH.\nThis application uses ffprobe (part of ffmpeg) as a fallback for:\n  1. Getting audio durations of files mutagen cannot parse.\n\nPlease install ffmpeg. Common installation methods:\n  - macOS (using Homebrew): brew install ffmpeg\n  - Debian/Ubuntu Linux: sudo apt update && sudo apt install ffmpeg\n  - Fedora Linux: sudo dnf install ffmpeg\n  - Windows: Download from https://ffmpeg.org/download.html and add to PATH.\n\nAfter installation, please re-run this setup script or ensure\nffprobe is accessible from your terminal before running the app."
 fi
 echo ""
 
@@ -122,8 +122,8 @@ source "$VENV_DIR/bin/activate"
 print_info "Upgrading pip, setuptools, and wheel using '$PYTHON_EXEC' from venv..."
 "$PYTHON_EXEC" -m pip install --upgrade pip setuptools wheel
 
-print_info "Installing Flask and openai-whisper using '$PYTHON_EXEC' from venv..."
-"$PYTHON_EXEC" -m pip install flask openai-whisper
+print_info "Installing Flask, faster-whisper, soundfile and mutagen using '$PYTHON_EXEC' from venv..."
+"$PYTHON_EXEC" -m pip install flask faster-whisper soundfile mutagen
 
 echo ""
 echo "---------------------------------------------------------------------"
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for running the audiobook server under a production server.
+
+Run
+---
+    pip install gunicorn
+    gunicorn -k gthread --workers 1 --threads 8 -b 0.0.0.0:8000 wsgi:app
+
+Keep a single worker process: each process loads its own copy of the Whisper
+model and keeps its own job registry. Use threads for concurrency instead;
+the gthread worker does not tie up a process per streaming /gen_one or /gen_all
+response, and CTranslate2 releases the GIL while transcribing.
+"""
+from app import BOOKS, app, configure_logging
+
+BOOKS.mkdir(exist_ok=True) # Ensure the books directory exists
+configure_logging()